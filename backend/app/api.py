@@ -1,11 +1,17 @@
 """FastAPI routes for the mail service."""
 
+import asyncio
+import hashlib
+import hmac
 import logging
-from typing import List, Optional
+import time
+from typing import Annotated, List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import orjson
+from fastapi import APIRouter, Body, Depends, HTTPException, Response, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import OAuth2PasswordRequestForm
+from pydantic import BaseModel, TypeAdapter
 
 from .auth import (
     Token,
@@ -15,6 +21,7 @@ from .auth import (
     get_password_hash,
     verify_password,
 )
+from .config import settings
 from .mail_service import mail_service
 from .models import EmailHistory, EmailRequest, EmailResponse, HealthCheck
 from .validation import ValidationResult, validate_email_request
@@ -24,13 +31,86 @@ logger = logging.getLogger(__name__)
 # Create API router
 router = APIRouter()
 
+# Serialize lists straight to JSON bytes in pydantic-core
+_email_history_list_adapter = TypeAdapter(List[EmailHistory])
+_email_response_list_adapter = TypeAdapter(List[EmailResponse])
+
+# Static body of the root endpoint, encoded once at import
+_ROOT_RESPONSE_BODY = orjson.dumps(
+    {
+        "message": "Mail Service API",
+        "version": "0.1.0",
+        "from_email": "info@bionicaisolutions.com",
+        "endpoints": {
+            "send_email": "/send",
+            "send_email_batch": "/send/batch",
+            "email_history": "/history",
+            "health_check": "/health",
+        },
+    }
+)
+
+
+def _json_response(model: BaseModel) -> Response:
+    """Serialize a model the service built itself, skipping response_model checks.
+
+    Returning a ``Response`` keeps ``response_model`` for the OpenAPI schema
+    without FastAPI validating the outgoing data a second time.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
+# Digests of the mock user's credentials, compared in constant time
+_EXPECTED_USERNAME_DIGEST = hashlib.sha256(b"test").digest()
+_EXPECTED_PASSWORD_DIGEST = hashlib.sha256(b"test123").digest()
+
+
+def _credentials_match(username: str, password: str) -> bool:
+    """Check credentials without leaking which part differs via timing."""
+    username_ok = hmac.compare_digest(
+        hashlib.sha256(username.encode()).digest(), _EXPECTED_USERNAME_DIGEST
+    )
+    password_ok = hmac.compare_digest(
+        hashlib.sha256(password.encode()).digest(), _EXPECTED_PASSWORD_DIGEST
+    )
+    return username_ok & password_ok
+
+
+# Last SMTP connection check as (monotonic timestamp, connected)
+_smtp_status_cache: Tuple[float, bool] = (float("-inf"), False)
+_smtp_status_lock: Optional[asyncio.Lock] = None
+
+
+async def _get_smtp_connection_status() -> bool:
+    """Get SMTP connectivity, reusing the last result within the cache TTL.
+
+    Concurrent callers that find the cache stale share a single check.
+    """
+    global _smtp_status_cache, _smtp_status_lock
+
+    checked_at, connected = _smtp_status_cache
+    if time.monotonic() - checked_at < settings.health_check_cache_ttl:
+        return connected
+
+    if _smtp_status_lock is None:
+        _smtp_status_lock = asyncio.Lock()
+
+    async with _smtp_status_lock:
+        checked_at, connected = _smtp_status_cache
+        if time.monotonic() - checked_at < settings.health_check_cache_ttl:
+            return connected
+
+        connected = await mail_service.check_smtp_connection()
+        _smtp_status_cache = (time.monotonic(), connected)
+        return connected
+
 
 @router.post("/token", response_model=Token)
 async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends()):
     """Get access token for authentication."""
     # In a real application, validate against a database
     # For this example, we'll use a mock user
-    if form_data.username != "test" or form_data.password != "test123":
+    if not _credentials_match(form_data.username, form_data.password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -46,56 +126,91 @@ async def send_email(
     email_request: EmailRequest, current_user: User = Depends(get_current_active_user)
 ):
     """Send an email through kube-mail."""
-    try:
-        # Validate the request
-        validation_result = validate_email_request(email_request.dict())
-        validation_result.raise_if_invalid()
+    # Validate the request
+    validation_result = validate_email_request(email_request)
+    validation_result.raise_if_invalid()
 
-        # Send email
+    # Send email
+    try:
         response = await mail_service.send_email(email_request)
+    except Exception as e:
+        logger.error("Unexpected error sending email: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error while sending email",
+        )
+
+    if response.status.value == "failed":
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to send email: {response.error_message}",
+        )
+
+    return _json_response(response)
 
-        if response.status.value == "failed":
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to send email: {response.error_message}",
-            )
 
-        return response
+@router.post("/send/batch", response_model=List[EmailResponse])
+async def send_email_batch(
+    email_requests: Annotated[
+        List[EmailRequest],
+        Body(min_length=1, max_length=settings.max_batch_size),
+    ],
+    current_user: User = Depends(get_current_active_user),
+):
+    """Send a batch of emails concurrently.
+
+    The batch size is checked while the body is parsed, so an oversized batch
+    is rejected before its emails are validated.
+    """
+    # Validate every request before sending any of them
+    for index, email_request in enumerate(email_requests):
+        try:
+            validate_email_request(email_request).raise_if_invalid()
+        except HTTPException as e:
+            raise HTTPException(
+                status_code=e.status_code, detail=f"Email {index}: {e.detail}"
+            ) from e
 
-    except HTTPException:
-        raise
+    try:
+        responses = await mail_service.send_emails_batch(email_requests)
     except Exception as e:
-        logger.error(f"Unexpected error sending email: {str(e)}")
+        logger.error("Unexpected error sending email batch: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error while sending email",
+            detail="Internal server error while sending email batch",
         )
 
+    return Response(
+        content=_email_response_list_adapter.dump_json(responses),
+        media_type="application/json",
+    )
+
 
 @router.get("/history", response_model=List[EmailHistory])
 async def get_email_history(
     limit: int = 50, current_user: User = Depends(get_current_active_user)
 ):
     """Get email sending history."""
-    try:
-        if limit < 1 or limit > 1000:
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail="Limit must be between 1 and 1000",
-            )
+    if limit < 1 or limit > 1000:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Limit must be between 1 and 1000",
+        )
 
+    try:
         history = await mail_service.get_email_history(limit)
-        return history
-
-    except HTTPException:
-        raise
     except Exception as e:
-        logger.error(f"Error retrieving email history: {str(e)}")
+        logger.error("Error retrieving email history: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error while retrieving email history",
         )
 
+    return Response(
+        content=_email_history_list_adapter.dump_json(history),
+        media_type="application/json",
+    )
+
 
 @router.get("/history/{message_id}", response_model=EmailHistory)
 async def get_email_by_id(
@@ -104,53 +219,44 @@ async def get_email_by_id(
     """Get specific email by message ID."""
     try:
         email = await mail_service.get_email_by_id(message_id)
-        if not email:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Email with message ID {message_id} not found",
-            )
-
-        return email
-
-    except HTTPException:
-        raise
     except Exception as e:
-        logger.error(f"Error retrieving email {message_id}: {str(e)}")
+        logger.error("Error retrieving email %s: %s", message_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error while retrieving email",
         )
 
+    if not email:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Email with message ID {message_id} not found",
+        )
+
+    return _json_response(email)
+
 
 @router.get("/health", response_model=HealthCheck)
 async def health_check():
     """Health check endpoint."""
     try:
-        smtp_connection = await mail_service.check_smtp_connection()
+        smtp_connection = await _get_smtp_connection_status()
 
-        return HealthCheck(
-            status="healthy" if smtp_connection else "degraded",
-            version="0.1.0",
-            kube_mail_connection=smtp_connection,  # Keeping the field name for backward compatibility
+        return _json_response(
+            HealthCheck(
+                status="healthy" if smtp_connection else "degraded",
+                version="0.1.0",
+                kube_mail_connection=smtp_connection,  # Keeping the field name for backward compatibility
+            )
         )
 
     except Exception as e:
-        logger.error(f"Health check failed: {str(e)}")
-        return HealthCheck(
-            status="unhealthy", version="0.1.0", kube_mail_connection=False
+        logger.error("Health check failed: %s", e)
+        return _json_response(
+            HealthCheck(status="unhealthy", version="0.1.0", kube_mail_connection=False)
         )
 
 
 @router.get("/")
 async def root():
     """Root endpoint with API information."""
-    return {
-        "message": "Mail Service API",
-        "version": "0.1.0",
-        "from_email": "info@bionicaisolutions.com",
-        "endpoints": {
-            "send_email": "/send",
-            "email_history": "/history",
-            "health_check": "/health",
-        },
-    }
+    return Response(content=_ROOT_RESPONSE_BODY, media_type="application/json")
@@ -1,8 +1,9 @@
 """Configuration management for the mail service."""
 
+from functools import lru_cache
 from typing import List, Optional
 
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -16,6 +17,10 @@ class Settings(BaseSettings):
     use_tls: bool = True
     from_email: str = "info@bionicaisolutions.com"
     from_name: str = "Bionic AI Solutions"
+    smtp_pool_size: int = 5
+    max_batch_size: int = 100
+    history_cap: int = 10000
+    history_body_preview_chars: int = 256
 
     # Application Configuration
     app_name: str = "Mail Service"
@@ -23,6 +28,10 @@ class Settings(BaseSettings):
     debug: bool = False
     log_level: str = "INFO"
 
+    # Health check; keep the SMTP probe timeout below the k8s probe timeouts
+    health_check_cache_ttl: float = 5.0
+    smtp_check_timeout: float = 2.0
+
     # Security
     secret_key: str = "your-secret-key-here"
     access_token_expire_minutes: int = 30
@@ -30,9 +39,13 @@ class Settings(BaseSettings):
     # CORS Configuration
     cors_origins: List[str] = ["http://localhost:3000", "http://localhost:8080"]
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=False)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings instance."""
+    return Settings()
 
 
-settings = Settings()
+settings = get_settings()
@@ -0,0 +1,98 @@
+"""Logging configuration for the mail service."""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+import time
+
+from .config import settings
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+LOG_QUEUE_SIZE = 10000
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders the date/time part of asctime once per second."""
+
+    def __init__(self, fmt: str = LOG_FORMAT):
+        super().__init__(fmt)
+        self._cached_time = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt=None) -> str:
+        """Format the record time, reusing the last rendered second."""
+        second = int(record.created)
+        cached_second, cached_str = self._cached_time
+        if second != cached_second:
+            cached_str = time.strftime(
+                self.default_time_format, self.converter(second)
+            )
+            self._cached_time = (second, cached_str)
+        return self.default_msec_format % (cached_str, record.msecs)
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that drops and counts records when the queue is full."""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord):
+        """Enqueue a record without blocking, dropping it if the queue is full."""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def setup_logging() -> DroppingQueueHandler:
+    """Configure root logging to write through a background queue listener.
+
+    Records are prepared on the calling thread: the message is merged with its
+    arguments and any traceback is rendered. Only the final formatting and the
+    stream I/O happen on the listener thread, so a slow stream never blocks the
+    event loop. While the queue is full, new records are dropped and counted
+    instead of raising.
+
+    The listener starts here, together with the queue handler, so records are
+    written whether or not the ASGI lifespan runs. It is stopped at interpreter
+    exit, which flushes queued records and reports any dropped ones. The queue
+    handler is returned so its ``dropped`` count can be inspected.
+    """
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(CachedTimeFormatter())
+
+    log_queue: queue.Queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    queue_handler = DroppingQueueHandler(log_queue)
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(getattr(logging, settings.log_level.upper()))
+    root_logger.addHandler(queue_handler)
+
+    listener = logging.handlers.QueueListener(
+        log_queue, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(_stop_logging, listener, queue_handler)
+
+    return queue_handler
+
+
+def _stop_logging(
+    listener: logging.handlers.QueueListener, queue_handler: DroppingQueueHandler
+):
+    """Flush the queue listener and report records dropped on a full queue."""
+    listener.stop()
+    if queue_handler.dropped:
+        record = logging.LogRecord(
+            __name__,
+            logging.WARNING,
+            __file__,
+            0,
+            "Dropped %d log records because the log queue was full",
+            (queue_handler.dropped,),
+            None,
+        )
+        for handler in listener.handlers:
+            handler.handle(record)
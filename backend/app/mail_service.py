@@ -1,14 +1,21 @@
 """Mail service for sending emails via kube-mail."""
 
 import asyncio
+import base64
+import hashlib
 import logging
-import uuid
-from datetime import datetime
-from email import encoders
+import os
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.message import Message
 from email.mime.base import MIMEBase
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from typing import List, Optional
+from email.policy import compat32
+from itertools import islice
+from typing import AsyncIterator, List, Optional
 
 import aiosmtplib
 
@@ -18,6 +25,18 @@ from .validation import ValidationResult
 
 logger = logging.getLogger(__name__)
 
+# Serialize messages with the CRLF line endings SMTP DATA expects
+SMTP_POLICY = compat32.clone(linesep="\r\n")
+
+
+def new_message_id() -> str:
+    """Generate a unique, time-ordered message ID.
+
+    A 48-bit millisecond timestamp followed by 80 random bits, as 32 hex
+    characters, so IDs sort by creation time to the millisecond.
+    """
+    return f"{time.time_ns() // 1_000_000:012x}{os.urandom(10).hex()}"
+
 
 class MailService:
     """Service for sending emails through kube-mail."""
@@ -32,14 +51,28 @@ class MailService:
         )  # Default to False for postfix relay
         self.from_email = settings.from_email
         self.from_name = settings.from_name
-        self.email_history: List[EmailHistory] = []
+        self._from_header = f"{self.from_name} <{self.from_email}>"
+        self._message_id_domain = self.from_email.split("@", 1)[1]
+
+        # Most recent emails keyed by message ID, oldest first
+        self.history_cap = settings.history_cap
+        self.history_body_preview_chars = settings.history_body_preview_chars
+        self._history: "OrderedDict[str, EmailHistory]" = OrderedDict()
+
+        # Pool of authenticated SMTP connections reused across sends
+        self.pool_size = settings.smtp_pool_size
+        self._idle_connections: List[aiosmtplib.SMTP] = []
+        self._pool_semaphore: Optional[asyncio.Semaphore] = None
+        self.check_timeout = settings.smtp_check_timeout
 
     async def send_email(self, email_request: EmailRequest) -> EmailResponse:
         """Send an email through kube-mail."""
-        message_id = str(uuid.uuid4())
+        message_id = new_message_id()
 
         try:
-            # Create email history entry
+            # Create email history entry; only a preview and digest of the body
+            # are kept so large bodies are not pinned in memory
+            body = email_request.body
             email_history = EmailHistory(
                 message_id=message_id,
                 status=EmailStatus.PENDING,
@@ -47,22 +80,30 @@ class MailService:
                 cc=email_request.cc,
                 bcc=email_request.bcc,
                 subject=email_request.subject,
-                body=email_request.body,
+                body=body[: self.history_body_preview_chars],
+                body_length=len(body),
+                body_sha256=hashlib.sha256(body.encode("utf-8")).hexdigest(),
+                body_truncated=len(body) > self.history_body_preview_chars,
                 is_html=email_request.is_html,
             )
-            self.email_history.append(email_history)
+            self.add_to_history(email_history)
 
             # Create email message
             message = await self._create_email_message(email_request, message_id)
 
-            # Send email through SMTP
-            await self._send_via_smtp(message, email_request.to)
+            # Send email through SMTP; Bcc recipients only go in the envelope
+            recipients = [
+                *email_request.to,
+                *(email_request.cc or ()),
+                *(email_request.bcc or ()),
+            ]
+            await self._send_via_smtp(message, recipients)
 
             # Update status
             email_history.status = EmailStatus.SENT
-            email_history.sent_at = datetime.utcnow()
+            email_history.sent_at = datetime.now(timezone.utc)
 
-            logger.info(f"Email sent successfully. Message ID: {message_id}")
+            logger.info("Email sent successfully. Message ID: %s", message_id)
 
             return EmailResponse(
                 message_id=message_id,
@@ -79,7 +120,7 @@ class MailService:
                 email_history.error_message = str(e)
 
             logger.error(
-                f"Failed to send email. Message ID: {message_id}. Error: {str(e)}"
+                "Failed to send email. Message ID: %s. Error: %s", message_id, e
             )
 
             return EmailResponse(
@@ -90,61 +131,96 @@ class MailService:
                 error_message=str(e),
             )
 
+    async def send_emails_batch(
+        self, email_requests: List[EmailRequest], concurrency: Optional[int] = None
+    ) -> List[EmailResponse]:
+        """Send several emails concurrently over the SMTP connection pool.
+
+        Responses are returned in request order.
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.pool_size)
+
+        async def bounded_send(email_request: EmailRequest) -> EmailResponse:
+            async with semaphore:
+                return await self.send_email(email_request)
+
+        return list(await asyncio.gather(*map(bounded_send, email_requests)))
+
     async def _create_email_message(
         self, email_request: EmailRequest, message_id: str
-    ) -> MIMEMultipart:
-        """Create email message with proper headers and content."""
-        message = MIMEMultipart("alternative")
+    ) -> Message:
+        """Create email message with proper headers and content.
+
+        Emails without attachments are sent as a single text part; a
+        multipart/mixed wrapper is only built when there is something to attach.
+        """
+        subtype = "html" if email_request.is_html else "plain"
+        body_part = MIMEText(email_request.body, subtype, "utf-8")
+
+        if email_request.attachments:
+            message = MIMEMultipart("mixed")
+            message.attach(body_part)
+            await self._add_attachments(message, email_request.attachments)
+        else:
+            message = body_part
 
         # Set headers
-        message["From"] = f"{self.from_name} <{self.from_email}>"
+        message["From"] = self._from_header
         message["To"] = ", ".join(email_request.to)
         message["Subject"] = email_request.subject
-        message["Message-ID"] = f"<{message_id}@{self.from_email.split('@')[1]}>"
+        message["Message-ID"] = f"<{message_id}@{self._message_id_domain}>"
 
         if email_request.cc:
             message["Cc"] = ", ".join(email_request.cc)
 
-        # Add body content
-        if email_request.is_html:
-            html_part = MIMEText(email_request.body, "html", "utf-8")
-            message.attach(html_part)
-        else:
-            text_part = MIMEText(email_request.body, "plain", "utf-8")
-            message.attach(text_part)
+        return message
 
-        # Add attachments if any
-        if email_request.attachments:
-            await self._add_attachments(message, email_request.attachments)
+    @staticmethod
+    def _encode_file_base64(file_path: str) -> str:
+        """Base64-encode a file for MIME."""
+        with open(file_path, "rb") as attachment:
+            return base64.encodebytes(attachment.read()).decode("ascii")
 
-        return message
+    def _build_attachment_part(self, file_path: str) -> Optional[MIMEBase]:
+        """Read and encode one attachment; runs in a worker thread."""
+        try:
+            part = MIMEBase("application", "octet-stream")
+            part.set_payload(self._encode_file_base64(file_path))
+            part["Content-Transfer-Encoding"] = "base64"
+            part.add_header(
+                "Content-Disposition",
+                "attachment",
+                filename=os.path.basename(file_path),
+            )
+            return part
+        except FileNotFoundError:
+            logger.warning("Attachment file not found: %s", file_path)
+        except Exception as e:
+            logger.error("Error adding attachment %s: %s", file_path, e)
+        return None
 
     async def _add_attachments(self, message: MIMEMultipart, attachments: List[str]):
-        """Add file attachments to the email message."""
-        for file_path in attachments:
-            try:
-                with open(file_path, "rb") as attachment:
-                    part = MIMEBase("application", "octet-stream")
-                    part.set_payload(attachment.read())
-
-                encoders.encode_base64(part)
-                part.add_header(
-                    "Content-Disposition",
-                    f'attachment; filename= {file_path.split("/")[-1]}',
-                )
+        """Add file attachments to the email message.
+
+        Files are read and encoded concurrently in worker threads so disk I/O
+        never blocks the event loop.
+        """
+        parts = await asyncio.gather(
+            *(
+                asyncio.to_thread(self._build_attachment_part, file_path)
+                for file_path in attachments
+            )
+        )
+        for part in parts:
+            if part is not None:
                 message.attach(part)
-            except FileNotFoundError:
-                logger.warning(f"Attachment file not found: {file_path}")
-            except Exception as e:
-                logger.error(f"Error adding attachment {file_path}: {str(e)}")
 
-    async def _send_via_smtp(self, message: MIMEMultipart, recipients: List[str]):
-        """Send email through SMTP server."""
+    async def _connect(self) -> aiosmtplib.SMTP:
+        """Open a new SMTP connection, upgrading and authenticating as configured."""
+        smtp = aiosmtplib.SMTP(
+            hostname=self.host, port=self.port, use_tls=self.use_tls
+        )
         try:
-            # Connect to SMTP server
-            smtp = aiosmtplib.SMTP(
-                hostname=self.host, port=self.port, use_tls=self.use_tls
-            )
             await smtp.connect()
 
             if self.use_tls:
@@ -153,48 +229,134 @@ class MailService:
             # Login if credentials are provided (not needed for whitelisted IPs)
             if self.username and self.password:
                 await smtp.login(self.username, self.password)
+        except BaseException:
+            # Also on cancellation, so a half-open connection is not leaked
+            smtp.close()
+            raise
+
+        return smtp
+
+    async def _checkout_connection(self) -> aiosmtplib.SMTP:
+        """Take a live idle connection from the pool, or open a new one."""
+        while self._idle_connections:
+            smtp = self._idle_connections.pop()
+            try:
+                await smtp.noop()
+                return smtp
+            except Exception as e:
+                logger.debug("Dropping stale pooled SMTP connection: %s", e)
+                smtp.close()
+            except BaseException:
+                smtp.close()
+                raise
+
+        return await self._connect()
+
+    @asynccontextmanager
+    async def _smtp_connection(self) -> AsyncIterator[aiosmtplib.SMTP]:
+        """Borrow a pooled SMTP connection for the duration of the block.
+
+        At most ``pool_size`` connections are in use at once. Idle connections
+        are checked with NOOP before reuse. A connection whose block fails or is
+        cancelled is closed; otherwise it is returned to the pool.
+        """
+        if self._pool_semaphore is None:
+            self._pool_semaphore = asyncio.Semaphore(self.pool_size)
+
+        async with self._pool_semaphore:
+            smtp = await self._checkout_connection()
+            reusable = False
+            try:
+                yield smtp
+                reusable = True
+            finally:
+                if reusable:
+                    self._idle_connections.append(smtp)
+                else:
+                    smtp.close()
+
+    async def close(self):
+        """Close all idle pooled SMTP connections."""
+        while self._idle_connections:
+            smtp = self._idle_connections.pop()
+            try:
+                await smtp.quit()
+            except Exception as e:
+                logger.warning("Error closing SMTP connection: %s", e)
+                smtp.close()
+
+    async def _send_via_smtp(self, message: Message, recipients: List[str]):
+        """Send email through SMTP server.
 
-            # Send email
-            await smtp.send_message(message)
-            await smtp.quit()
+        The message is flattened to bytes once, before a pooled connection is
+        borrowed, and handed to SMTP with an explicit envelope.
+        """
+        message_bytes = message.as_bytes(policy=SMTP_POLICY)
+        try:
+            async with self._smtp_connection() as smtp:
+                await smtp.sendmail(self.from_email, recipients, message_bytes)
 
-            logger.info(f"Email sent to {len(recipients)} recipients via SMTP")
+            logger.info("Email sent to %d recipients via SMTP", len(recipients))
 
         except Exception as e:
-            logger.error(f"Failed to send email via SMTP: {str(e)}")
+            logger.error("Failed to send email via SMTP: %s", e)
             raise
 
+    def add_to_history(self, email_history: EmailHistory):
+        """Record an email, evicting the oldest entries beyond the history cap."""
+        self._history[email_history.message_id] = email_history
+        self._history.move_to_end(email_history.message_id)
+        while len(self._history) > self.history_cap:
+            self._history.popitem(last=False)
+
     async def get_email_history(self, limit: int = 50) -> List[EmailHistory]:
-        """Get email history."""
-        return self.email_history[-limit:] if self.email_history else []
+        """Get the most recent emails, oldest first."""
+        recent = list(islice(reversed(self._history.values()), limit))
+        recent.reverse()
+        return recent
 
     async def get_email_by_id(self, message_id: str) -> Optional[EmailHistory]:
         """Get email by message ID."""
-        for email in self.email_history:
-            if email.message_id == message_id:
-                return email
-        return None
+        return self._history.get(message_id)
 
     async def check_smtp_connection(self) -> bool:
-        """Check if SMTP service is reachable."""
-        try:
-            smtp = aiosmtplib.SMTP(
-                hostname=self.host, port=self.port, use_tls=self.use_tls
-            )
-            await smtp.connect()
-
-            if self.use_tls:
-                await smtp.starttls()
-
-            if self.username and self.password:
-                await smtp.login(self.username, self.password)
+        """Check if SMTP service is reachable.
 
-            await smtp.quit()
+        The probe does not take a pool slot, so it never waits behind in-flight
+        sends, and it gives up after ``check_timeout`` seconds.
+        """
+        try:
+            await asyncio.wait_for(self._probe_smtp(), timeout=self.check_timeout)
             return True
         except Exception as e:
-            logger.error(f"SMTP connection check failed: {str(e)}")
+            logger.error("SMTP connection check failed: %s", e)
             return False
 
+    async def _probe_smtp(self):
+        """NOOP an idle pooled connection, or open a new one.
+
+        A new connection is kept for later sends if the pool has room for it.
+        """
+        while self._idle_connections:
+            smtp = self._idle_connections.pop()
+            try:
+                await smtp.noop()
+            except Exception as e:
+                logger.debug("Dropping stale pooled SMTP connection: %s", e)
+                smtp.close()
+                continue
+            except BaseException:
+                smtp.close()
+                raise
+            self._idle_connections.append(smtp)
+            return
+
+        smtp = await self._connect()
+        if len(self._idle_connections) < self.pool_size:
+            self._idle_connections.append(smtp)
+        else:
+            smtp.close()
+
 
 # Global mail service instance
 mail_service = MailService()
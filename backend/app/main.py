@@ -1,32 +1,64 @@
 """Main FastAPI application for the mail service."""
 
 import logging
+from contextlib import asynccontextmanager
+from typing import Sequence
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp
 
 from .api import router
 from .config import settings
+from .logging_config import setup_logging
+from .mail_service import mail_service
 
 # Configure logging
-logging.basicConfig(
-    level=getattr(logging, settings.log_level.upper()),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+log_handler = setup_logging()
 
 logger = logging.getLogger(__name__)
 
+
+class FrozenOriginsCORSMiddleware(CORSMiddleware):
+    """CORS middleware that checks request origins against a frozenset."""
+
+    def __init__(self, app: ASGIApp, allow_origins: Sequence[str] = (), **kwargs):
+        super().__init__(app, allow_origins=allow_origins, **kwargs)
+        self.allow_origins = frozenset(self.allow_origins)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup and shutdown."""
+    logger.info("Starting %s v%s", settings.app_name, settings.app_version)
+    logger.info("SMTP host: %s:%s", settings.smtp_host, settings.smtp_port)
+    logger.info("From email: %s", settings.from_email)
+    logger.info("TLS enabled: %s", settings.use_tls)
+
+    yield
+
+    logger.info("Shutting down %s", settings.app_name)
+    await mail_service.close()
+    if log_handler.dropped:
+        logger.warning(
+            "Dropped %d log records on a full log queue", log_handler.dropped
+        )
+
+
 # Create FastAPI application
 app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     description="Mail service for sending emails via SMTP",
     debug=settings.debug,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
 app.add_middleware(
-    CORSMiddleware,
+    FrozenOriginsCORSMiddleware,
     allow_origins=settings.cors_origins,
     allow_credentials=True,
     allow_methods=["*"],
@@ -37,23 +69,6 @@ app.add_middleware(
 app.include_router(router, prefix="/api/v1")
 
 
-# Startup event
-@app.on_event("startup")
-async def startup_event():
-    """Application startup event."""
-    logger.info(f"Starting {settings.app_name} v{settings.app_version}")
-    logger.info(f"SMTP host: {settings.smtp_host}:{settings.smtp_port}")
-    logger.info(f"From email: {settings.from_email}")
-    logger.info(f"TLS enabled: {settings.use_tls}")
-
-
-# Shutdown event
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Application shutdown event."""
-    logger.info(f"Shutting down {settings.app_name}")
-
-
 if __name__ == "__main__":
     import uvicorn
 
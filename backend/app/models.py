@@ -1,10 +1,26 @@
 """Pydantic models for the mail service."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
-from typing import List, Optional
+from typing import Annotated, Any, List, Optional
 
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic import AfterValidator, BaseModel, EmailStr, Field, StringConstraints
+
+
+def _utcnow() -> datetime:
+    """Return the current time as an aware UTC datetime."""
+    return datetime.now(timezone.utc)
+
+
+def _non_empty(message: str) -> AfterValidator:
+    """Build a validator that rejects empty values with a readable message."""
+
+    def check(value: Any) -> Any:
+        if not value:
+            raise ValueError(message)
+        return value
+
+    return AfterValidator(check)
 
 
 class EmailStatus(str, Enum):
@@ -19,42 +35,29 @@ class EmailStatus(str, Enum):
 class EmailRequest(BaseModel):
     """Request model for sending an email."""
 
-    to: List[EmailStr] = Field(..., description="List of recipient email addresses")
+    to: Annotated[
+        List[EmailStr], _non_empty("At least one recipient must be provided")
+    ] = Field(..., description="List of recipient email addresses")
     cc: Optional[List[EmailStr]] = Field(None, description="List of CC email addresses")
     bcc: Optional[List[EmailStr]] = Field(
         None, description="List of BCC email addresses"
     )
-    subject: str = Field(..., min_length=1, max_length=200, description="Email subject")
-    body: str = Field(..., min_length=1, description="Email body content")
+    # Whitespace is stripped and the length checked by pydantic-core
+    subject: Annotated[
+        str,
+        StringConstraints(strip_whitespace=True, max_length=200),
+        _non_empty("Subject cannot be empty"),
+    ] = Field(..., description="Email subject")
+    body: Annotated[
+        str,
+        StringConstraints(strip_whitespace=True),
+        _non_empty("Body cannot be empty"),
+    ] = Field(..., description="Email body content")
     is_html: bool = Field(False, description="Whether the body is HTML content")
     attachments: Optional[List[str]] = Field(
         None, description="List of attachment file paths"
     )
 
-    @field_validator("to")
-    @classmethod
-    def validate_recipients(cls, v):
-        """Validate that at least one recipient is provided."""
-        if not v or len(v) == 0:
-            raise ValueError("At least one recipient must be provided")
-        return v
-
-    @field_validator("subject")
-    @classmethod
-    def validate_subject(cls, v):
-        """Validate subject is not empty after stripping."""
-        if not v.strip():
-            raise ValueError("Subject cannot be empty")
-        return v.strip()
-
-    @field_validator("body")
-    @classmethod
-    def validate_body(cls, v):
-        """Validate body is not empty after stripping."""
-        if not v.strip():
-            raise ValueError("Body cannot be empty")
-        return v.strip()
-
 
 class EmailResponse(BaseModel):
     """Response model for email operations."""
@@ -80,11 +83,20 @@ class EmailHistory(BaseModel):
     cc: Optional[List[str]] = None
     bcc: Optional[List[str]] = None
     subject: str
-    body: str
+    body: str = Field(..., description="Leading part of the email body")
+    body_length: Optional[int] = Field(
+        None, description="Length of the full email body in characters"
+    )
+    body_sha256: Optional[str] = Field(
+        None, description="SHA-256 hex digest of the full UTF-8 email body"
+    )
+    body_truncated: bool = Field(
+        False, description="Whether body holds only a preview of the email body"
+    )
     is_html: bool
     sent_at: Optional[datetime] = None
     error_message: Optional[str] = None
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
 
 
 class HealthCheck(BaseModel):
@@ -92,5 +104,5 @@ class HealthCheck(BaseModel):
 
     status: str = Field(..., description="Service status")
     version: str = Field(..., description="Application version")
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
     kube_mail_connection: bool = Field(..., description="kube-mail connection status")
@@ -1,11 +1,21 @@
 """Validation utilities for the mail service."""
 
 import os
-from typing import Any, Dict, List, Optional
+from enum import Enum
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 from fastapi import HTTPException, status
 from pydantic import ValidationError
 
+try:
+    from email_validator import EmailNotValidError, validate_email
+except ImportError:
+    # If email-validator is not available, address validation is skipped
+    validate_email = None
+
+from .models import EmailRequest
+
 # Constants for attachment validation
 MAX_ATTACHMENT_SIZE = 10 * 1024 * 1024  # 10MB
 ALLOWED_MIME_TYPES = {
@@ -20,78 +30,116 @@ ALLOWED_MIME_TYPES = {
     ".gif": "image/gif",
     ".txt": "text/plain",
 }
+_ALLOWED_EXTENSIONS = frozenset(ALLOWED_MIME_TYPES)
+
+
+class ErrorKind(str, Enum):
+    """Kind of validation failure, in order of precedence."""
+
+    EMAIL = "email"
+    NOT_FOUND = "not_found"
+    UNAUTHORIZED = "unauthorized"
+    TOO_LARGE = "too_large"
+    UNSUPPORTED_MEDIA_TYPE = "unsupported_media_type"
+    INVALID = "invalid"
+
+
+_ERROR_KIND_RESPONSES = {
+    ErrorKind.EMAIL: (status.HTTP_422_UNPROCESSABLE_ENTITY, "Email validation error"),
+    ErrorKind.NOT_FOUND: (status.HTTP_404_NOT_FOUND, "Resource not found"),
+    ErrorKind.UNAUTHORIZED: (status.HTTP_401_UNAUTHORIZED, "Authorization error"),
+    ErrorKind.TOO_LARGE: (
+        status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        "Request too large",
+    ),
+    ErrorKind.UNSUPPORTED_MEDIA_TYPE: (
+        status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+        "Unsupported media type",
+    ),
+    ErrorKind.INVALID: (status.HTTP_422_UNPROCESSABLE_ENTITY, "Validation error"),
+}
+
+# Keywords in the stringified errors, for results built without an explicit kind
+_ERROR_KEYWORDS = (
+    (("email",), ErrorKind.EMAIL),
+    (("not found",), ErrorKind.NOT_FOUND),
+    (("unauthorized", "forbidden"), ErrorKind.UNAUTHORIZED),
+    (("too large", "size"), ErrorKind.TOO_LARGE),
+    (("unsupported", "media type"), ErrorKind.UNSUPPORTED_MEDIA_TYPE),
+)
 
 
 class ValidationResult:
     """Validation result container with error handling."""
 
-    def __init__(self, is_valid: bool = True, errors: Optional[Dict[str, Any]] = None):
+    __slots__ = ("is_valid", "errors", "kind")
+
+    def __init__(
+        self,
+        is_valid: bool = True,
+        errors: Optional[Dict[str, Any]] = None,
+        kind: Optional[ErrorKind] = None,
+    ):
         self.is_valid = is_valid
         self.errors = errors or {}
 
+        # Validators pass the kind of failure; otherwise infer it from the text
+        if kind is None and not is_valid:
+            kind = self._classify(self.errors)
+        self.kind = kind
+
+    @staticmethod
+    def _classify(errors: Dict[str, Any]) -> ErrorKind:
+        """Infer the kind of failure from keywords in the errors."""
+        message = str(errors).lower()
+        for keywords, kind in _ERROR_KEYWORDS:
+            if any(keyword in message for keyword in keywords):
+                return kind
+        return ErrorKind.INVALID
+
     def raise_if_invalid(self):
         """Raise HTTPException if validation failed."""
         if not self.is_valid:
-            # Map validation errors to appropriate HTTP status codes
-            if "email" in str(self.errors).lower():
-                raise HTTPException(
-                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                    detail=f"Email validation error: {self.errors}",
-                )
-            elif "not found" in str(self.errors).lower():
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Resource not found: {self.errors}",
-                )
-            elif (
-                "unauthorized" in str(self.errors).lower()
-                or "forbidden" in str(self.errors).lower()
-            ):
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail=f"Authorization error: {self.errors}",
-                )
-            elif (
-                "too large" in str(self.errors).lower()
-                or "size" in str(self.errors).lower()
-            ):
-                raise HTTPException(
-                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                    detail=f"Request too large: {self.errors}",
-                )
-            elif (
-                "unsupported" in str(self.errors).lower()
-                or "media type" in str(self.errors).lower()
-            ):
-                raise HTTPException(
-                    status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
-                    detail=f"Unsupported media type: {self.errors}",
-                )
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                    detail=f"Validation error: {self.errors}",
-                )
+            status_code, label = _ERROR_KIND_RESPONSES[self.kind]
+            raise HTTPException(
+                status_code=status_code, detail=f"{label}: {self.errors}"
+            )
 
 
-def validate_email_request(data: Dict[str, Any]) -> ValidationResult:
-    """Validate email request data."""
-    try:
-        from .models import EmailRequest
+class _ValidResult(ValidationResult):
+    """Read-only successful result, safe to share between callers."""
 
-        # Validate basic structure
-        email_request = EmailRequest(**data)
+    __slots__ = ()
+
+    def __init__(self):
+        object.__setattr__(self, "is_valid", True)
+        object.__setattr__(self, "errors", MappingProxyType({}))
+        object.__setattr__(self, "kind", None)
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError("The shared valid ValidationResult is read-only")
+
+
+# Shared result for successful validations
+_VALID = _ValidResult()
 
-        # Validate email addresses
-        all_emails = email_request.to[:]
-        if email_request.cc:
-            all_emails.extend(email_request.cc)
-        if email_request.bcc:
-            all_emails.extend(email_request.bcc)
 
-        email_validation = validate_email_addresses(all_emails)
-        if not email_validation.is_valid:
-            return email_validation
+def validate_email_request(
+    data: Union[Dict[str, Any], EmailRequest]
+) -> ValidationResult:
+    """Validate email request data.
+
+    Accepts either raw request data or an already-built ``EmailRequest``; the
+    model is used as-is rather than being copied back into a dict. Recipient
+    addresses are checked by the model's ``EmailStr`` fields, so only the
+    attachments need validating here.
+    """
+    try:
+        # Validate basic structure
+        if isinstance(data, EmailRequest):
+            email_request = data
+        else:
+            email_request = EmailRequest(**data)
 
         # Validate attachments if present
         if email_request.attachments:
@@ -99,19 +147,16 @@ def validate_email_request(data: Dict[str, Any]) -> ValidationResult:
             if not attachment_validation.is_valid:
                 return attachment_validation
 
-        return ValidationResult(is_valid=True)
+        return _VALID
 
     except ValidationError as e:
         return ValidationResult(is_valid=False, errors=e.errors())
 
 
-def validate_email_addresses(emails: List[str]) -> ValidationResult:
+def validate_email_addresses(emails: Iterable[str]) -> ValidationResult:
     """Validate list of email addresses."""
-    try:
-        from email_validator import EmailNotValidError, validate_email
-    except ImportError:
-        # If email-validator is not available, skip validation
-        return ValidationResult(is_valid=True)
+    if validate_email is None:
+        return _VALID
 
     errors = []
     for i, email in enumerate(emails):
@@ -122,41 +167,52 @@ def validate_email_addresses(emails: List[str]) -> ValidationResult:
             errors.append(f"Invalid email at position {i}: {email} - {str(e)}")
 
     if errors:
-        return ValidationResult(is_valid=False, errors={"email_validation": errors})
+        return ValidationResult(
+            is_valid=False,
+            errors={"email_validation": errors},
+            kind=ErrorKind.EMAIL,
+        )
 
-    return ValidationResult(is_valid=True)
+    return _VALID
 
 
 def validate_attachments(attachments: List[str]) -> ValidationResult:
     """Validate email attachments."""
     errors = []
+    kinds = set()
 
     for attachment_path in attachments:
         try:
-            # Check if file exists
-            if not os.path.exists(attachment_path):
+            # Check the file exists and get its size with a single stat call
+            try:
+                file_size = os.stat(attachment_path).st_size
+            except OSError:
                 errors.append(f"Attachment not found: {attachment_path}")
+                kinds.add(ErrorKind.NOT_FOUND)
                 continue
 
-            # Check file size
-            file_size = os.path.getsize(attachment_path)
             if file_size > MAX_ATTACHMENT_SIZE:
                 errors.append(
                     f"Attachment too large: {attachment_path} "
                     f"({file_size / 1024 / 1024:.1f}MB > {MAX_ATTACHMENT_SIZE / 1024 / 1024:.1f}MB)"
                 )
+                kinds.add(ErrorKind.TOO_LARGE)
 
             # Check file type
-            _, ext = os.path.splitext(attachment_path.lower())
-            if ext not in ALLOWED_MIME_TYPES:
+            ext = os.path.splitext(attachment_path)[1].lower()
+            if ext not in _ALLOWED_EXTENSIONS:
                 errors.append(f"Unsupported file type: {ext} for {attachment_path}")
+                kinds.add(ErrorKind.UNSUPPORTED_MEDIA_TYPE)
 
         except Exception as e:
             errors.append(f"Error validating attachment {attachment_path}: {str(e)}")
+            kinds.add(ErrorKind.INVALID)
 
     if errors:
         return ValidationResult(
-            is_valid=False, errors={"attachment_validation": errors}
+            is_valid=False,
+            errors={"attachment_validation": errors},
+            kind=next(kind for kind in ErrorKind if kind in kinds),
         )
 
-    return ValidationResult(is_valid=True)
+    return _VALID
@@ -0,0 +1,17 @@
+"""Shared fixtures for the backend tests."""
+
+import pytest
+
+from app.validation import MAX_ATTACHMENT_SIZE
+
+
+@pytest.fixture(scope="session")
+def large_attachment(tmp_path_factory):
+    """Create a file one byte over the attachment size limit, once per session.
+
+    The file is sparse, so it has the right size without writing its contents.
+    """
+    path = tmp_path_factory.mktemp("large_attachment") / "large.pdf"
+    with open(path, "wb") as f:
+        f.truncate(MAX_ATTACHMENT_SIZE + 1)
+    return path
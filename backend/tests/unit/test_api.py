@@ -0,0 +1,151 @@
+"""Unit tests for the API routes."""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+from fastapi.testclient import TestClient
+
+from app import api
+from app.auth import User, get_current_active_user
+from app.config import settings
+from app.main import app
+from app.models import EmailHistory, EmailResponse, EmailStatus
+
+
+@pytest.fixture
+def client():
+    """Create a test client authenticated as a mock user."""
+    app.dependency_overrides[get_current_active_user] = lambda: User(username="test")
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_smtp_status_cache():
+    """Start every test with an expired SMTP status cache."""
+    api._smtp_status_cache = (float("-inf"), False)
+    yield
+    api._smtp_status_cache = (float("-inf"), False)
+
+
+@pytest.mark.asyncio
+async def test_smtp_connection_status_is_cached():
+    """Test that repeated health checks reuse the cached SMTP status."""
+    with patch.object(
+        api.mail_service, "check_smtp_connection", new_callable=AsyncMock
+    ) as mock_check:
+        mock_check.return_value = True
+
+        assert await api._get_smtp_connection_status() is True
+        assert await api._get_smtp_connection_status() is True
+
+        mock_check.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_smtp_connection_status_refreshes_after_ttl():
+    """Test that the SMTP status is checked again once the TTL expires."""
+    with patch.object(
+        api.mail_service, "check_smtp_connection", new_callable=AsyncMock
+    ) as mock_check:
+        mock_check.return_value = False
+
+        await api._get_smtp_connection_status()
+        api._smtp_status_cache = (float("-inf"), False)
+        await api._get_smtp_connection_status()
+
+        assert mock_check.call_count == 2
+
+
+def test_send_email_batch(client):
+    """Test that the batch endpoint returns one response per email."""
+    email_data = {"to": ["test@example.com"], "subject": "Test", "body": "Body"}
+    with patch.object(
+        api.mail_service, "send_emails_batch", new_callable=AsyncMock
+    ) as mock_send:
+        mock_send.return_value = [
+            EmailResponse(
+                message_id=f"id-{i}",
+                status=EmailStatus.SENT,
+                to=email_data["to"],
+                subject=email_data["subject"],
+            )
+            for i in range(2)
+        ]
+
+        response = client.post("/api/v1/send/batch", json=[email_data, email_data])
+
+    assert response.status_code == 200
+    assert [r["message_id"] for r in response.json()] == ["id-0", "id-1"]
+
+
+def test_send_email_batch_rejects_empty_batch(client):
+    """Test that an empty batch is rejected."""
+    response = client.post("/api/v1/send/batch", json=[])
+
+    assert response.status_code == 422
+
+
+def test_send_email_batch_rejects_oversized_batch(client):
+    """Test that a batch over the size limit is rejected during parsing."""
+    email_data = {"to": ["test@example.com"], "subject": "Test", "body": "Body"}
+    with patch.object(
+        api.mail_service, "send_emails_batch", new_callable=AsyncMock
+    ) as mock_send:
+        response = client.post(
+            "/api/v1/send/batch", json=[email_data] * (settings.max_batch_size + 1)
+        )
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["type"] == "too_long"
+    mock_send.assert_not_called()
+
+
+def test_send_email_batch_reports_invalid_email_index(client):
+    """Test that a batch validation error names the failing email."""
+    email_data = {"to": ["test@example.com"], "subject": "Test", "body": "Body"}
+    invalid_data = {**email_data, "attachments": ["/nonexistent/file.pdf"]}
+    with patch.object(
+        api.mail_service, "send_emails_batch", new_callable=AsyncMock
+    ) as mock_send:
+        response = client.post("/api/v1/send/batch", json=[email_data, invalid_data])
+
+    assert response.status_code == 404
+    assert response.json()["detail"].startswith("Email 1: ")
+    mock_send.assert_not_called()
+
+
+def test_cors_preflight_checks_allowed_origins(client):
+    """Test that CORS preflight accepts configured origins only."""
+    headers = {"Access-Control-Request-Method": "GET"}
+
+    allowed = client.options(
+        "/api/v1/health", headers={**headers, "Origin": "http://localhost:3000"}
+    )
+    rejected = client.options(
+        "/api/v1/health", headers={**headers, "Origin": "http://example.com"}
+    )
+
+    assert allowed.headers["access-control-allow-origin"] == "http://localhost:3000"
+    assert rejected.status_code == 400
+
+
+def test_get_email_by_id_returns_history_entry(client):
+    """Test that a history entry is returned as JSON by message ID."""
+    entry = EmailHistory(
+        message_id="test-id",
+        status=EmailStatus.SENT,
+        to=["test@example.com"],
+        subject="Test",
+        body="Body",
+        is_html=False,
+    )
+    with patch.object(
+        api.mail_service, "get_email_by_id", new_callable=AsyncMock
+    ) as mock_get:
+        mock_get.return_value = entry
+
+        response = client.get("/api/v1/history/test-id")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == entry.model_dump(mode="json")
@@ -0,0 +1,34 @@
+"""Unit tests for the logging configuration."""
+
+import io
+import logging
+import logging.handlers
+import queue
+
+from app.logging_config import DroppingQueueHandler, _stop_logging
+
+
+def test_dropping_queue_handler_counts_dropped_records():
+    """Test that records are dropped and counted once the queue is full."""
+    handler = DroppingQueueHandler(queue.Queue(maxsize=1))
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, "msg", None, None)
+    
+    handler.handle(record)
+    handler.handle(record)
+    
+    assert handler.queue.qsize() == 1
+    assert handler.dropped == 1
+
+
+def test_stop_logging_reports_dropped_records():
+    """Test that stopping the listener reports how many records were dropped."""
+    log_queue = queue.Queue(maxsize=1)
+    handler = DroppingQueueHandler(log_queue)
+    handler.dropped = 3
+    output = io.StringIO()
+    listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler(output))
+    listener.start()
+    
+    _stop_logging(listener, handler)
+    
+    assert "Dropped 3 log records" in output.getvalue()
@@ -1,5 +1,8 @@
 """Unit tests for the mail service."""
 
+import asyncio
+import hashlib
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime
@@ -81,8 +84,9 @@ async def test_send_email_success(mail_service, valid_email_request):
         # Verify SMTP calls
         mock_smtp_instance.connect.assert_called_once()
         # Note: starttls and login are not called for postfix relay
-        mock_smtp_instance.send_message.assert_called_once()
-        mock_smtp_instance.quit.assert_called_once()
+        mock_smtp_instance.sendmail.assert_called_once()
+        # The connection stays open in the pool until the service is closed
+        mock_smtp_instance.quit.assert_not_called()
         
         # Verify response
         assert isinstance(response, EmailResponse)
@@ -91,6 +95,61 @@ async def test_send_email_success(mail_service, valid_email_request):
         assert response.subject == valid_email_request.subject
         assert response.sent_at is not None
 
+        await mail_service.close()
+        mock_smtp_instance.quit.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_send_email_reuses_pooled_connection(mail_service, valid_email_request):
+    """Test that consecutive sends share one pooled SMTP connection."""
+    with patch("aiosmtplib.SMTP") as mock_smtp:
+        mock_smtp_instance = AsyncMock()
+        mock_smtp.return_value = mock_smtp_instance
+        
+        await mail_service.send_email(valid_email_request)
+        await mail_service.send_email(valid_email_request)
+        
+        mock_smtp.assert_called_once()
+        mock_smtp_instance.connect.assert_called_once()
+        mock_smtp_instance.noop.assert_called_once()
+        assert mock_smtp_instance.sendmail.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_send_email_replaces_stale_pooled_connection(
+    mail_service, valid_email_request
+):
+    """Test that a pooled connection failing NOOP is closed and replaced."""
+    with patch("aiosmtplib.SMTP") as mock_smtp:
+        stale, fresh = AsyncMock(), AsyncMock()
+        stale.close = MagicMock()
+        stale.noop.side_effect = Exception("Connection lost")
+        mock_smtp.side_effect = [stale, fresh]
+        
+        await mail_service.send_email(valid_email_request)
+        response = await mail_service.send_email(valid_email_request)
+        
+        assert response.status == EmailStatus.SENT
+        stale.close.assert_called_once()
+        fresh.sendmail.assert_called_once()
+        assert mail_service._idle_connections == [fresh]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_send_closes_connection(mail_service, valid_email_request):
+    """Test that a send cancelled mid-flight closes its pooled connection."""
+    with patch("aiosmtplib.SMTP") as mock_smtp:
+        mock_smtp_instance = AsyncMock()
+        mock_smtp_instance.close = MagicMock()
+        mock_smtp_instance.sendmail.side_effect = asyncio.CancelledError()
+        mock_smtp.return_value = mock_smtp_instance
+        
+        with pytest.raises(asyncio.CancelledError):
+            await mail_service.send_email(valid_email_request)
+        
+        mock_smtp_instance.close.assert_called_once()
+        assert mail_service._idle_connections == []
+
 
 @pytest.mark.asyncio
 async def test_send_email_with_html(mail_service, valid_html_email_request):
@@ -102,7 +161,7 @@ async def test_send_email_with_html(mail_service, valid_html_email_request):
         response = await mail_service.send_email(valid_html_email_request)
         
         # Verify email was sent
-        mock_smtp_instance.send_message.assert_called_once()
+        mock_smtp_instance.sendmail.assert_called_once()
         assert response.status == EmailStatus.SENT
 
 
@@ -116,7 +175,12 @@ async def test_send_email_with_cc_bcc(mail_service, email_request_with_cc_bcc):
         response = await mail_service.send_email(email_request_with_cc_bcc)
         
         # Verify email was sent
-        mock_smtp_instance.send_message.assert_called_once()
+        mock_smtp_instance.sendmail.assert_called_once()
+        sender, recipients, message_bytes = mock_smtp_instance.sendmail.call_args.args
+        assert sender == mail_service.from_email
+        assert recipients == ["test@example.com", "cc@example.com", "bcc@example.com"]
+        assert b"Subject: Test Email with CC/BCC\r\n" in message_bytes
+        assert b"bcc@example.com" not in message_bytes
         assert response.status == EmailStatus.SENT
 
 
@@ -130,7 +194,7 @@ async def test_send_email_with_attachments(mail_service, email_request_with_atta
         response = await mail_service.send_email(email_request_with_attachments)
         
         # Verify email was sent
-        mock_smtp_instance.send_message.assert_called_once()
+        mock_smtp_instance.sendmail.assert_called_once()
         assert response.status == EmailStatus.SENT
 
 
@@ -140,7 +204,8 @@ async def test_send_email_smtp_error(mail_service, valid_email_request):
     with patch("aiosmtplib.SMTP") as mock_smtp:
         # Configure mock to raise an exception
         mock_smtp_instance = AsyncMock()
-        mock_smtp_instance.send_message.side_effect = Exception("SMTP error")
+        mock_smtp_instance.close = MagicMock()
+        mock_smtp_instance.sendmail.side_effect = Exception("SMTP error")
         mock_smtp.return_value = mock_smtp_instance
         
         response = await mail_service.send_email(valid_email_request)
@@ -148,6 +213,9 @@ async def test_send_email_smtp_error(mail_service, valid_email_request):
         # Verify error handling
         assert response.status == EmailStatus.FAILED
         assert "SMTP error" in response.error_message
+        # A connection that failed mid-send is not returned to the pool
+        mock_smtp_instance.close.assert_called_once()
+        assert mail_service._idle_connections == []
 
 
 @pytest.mark.asyncio
@@ -161,7 +229,56 @@ async def test_check_smtp_connection_success(mail_service):
         
         assert result is True
         mock_smtp_instance.connect.assert_called_once()
-        mock_smtp_instance.quit.assert_called_once()
+        mock_smtp_instance.quit.assert_not_called()
+        assert mail_service._idle_connections == [mock_smtp_instance]
+
+
+@pytest.mark.asyncio
+async def test_check_smtp_connection_reuses_pooled_connection(
+    mail_service, valid_email_request
+):
+    """Test that the connection check borrows the connection used for sends."""
+    with patch("aiosmtplib.SMTP") as mock_smtp:
+        mock_smtp_instance = AsyncMock()
+        mock_smtp.return_value = mock_smtp_instance
+        
+        await mail_service.send_email(valid_email_request)
+        result = await mail_service.check_smtp_connection()
+        
+        assert result is True
+        assert mock_smtp.call_count == 1
+        mock_smtp_instance.noop.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_check_smtp_connection_does_not_wait_for_pool(mail_service):
+    """Test that the connection check runs while every pool slot is taken."""
+    mail_service._pool_semaphore = asyncio.Semaphore(0)
+    with patch("aiosmtplib.SMTP") as mock_smtp:
+        mock_smtp.return_value = AsyncMock()
+        
+        result = await asyncio.wait_for(mail_service.check_smtp_connection(), 1.0)
+        
+        assert result is True
+
+
+@pytest.mark.asyncio
+async def test_check_smtp_connection_times_out(mail_service):
+    """Test that a hanging connection check fails within the check timeout."""
+    async def hang():
+        await asyncio.sleep(10)
+
+    mail_service.check_timeout = 0.01
+    with patch("aiosmtplib.SMTP") as mock_smtp:
+        mock_smtp_instance = AsyncMock()
+        mock_smtp_instance.close = MagicMock()
+        mock_smtp_instance.connect.side_effect = hang
+        mock_smtp.return_value = mock_smtp_instance
+        
+        result = await mail_service.check_smtp_connection()
+        
+        assert result is False
+        mock_smtp_instance.close.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -169,6 +286,7 @@ async def test_check_smtp_connection_failure(mail_service):
     """Test failed SMTP connection check."""
     with patch("aiosmtplib.SMTP") as mock_smtp:
         mock_smtp_instance = AsyncMock()
+        mock_smtp_instance.close = MagicMock()
         mock_smtp_instance.connect.side_effect = Exception("Connection failed")
         mock_smtp.return_value = mock_smtp_instance
         
@@ -204,3 +322,127 @@ async def test_get_email_by_id(mail_service, valid_email_request):
     assert email.message_id == response.message_id
     assert email.to == valid_email_request.to
     assert email.subject == valid_email_request.subject
+
+
+@pytest.mark.asyncio
+async def test_send_emails_batch(mail_service, valid_email_request, valid_html_email_request):
+    """Test sending a batch of emails concurrently."""
+    with patch("aiosmtplib.SMTP") as mock_smtp:
+        mock_smtp_instance = AsyncMock()
+        mock_smtp.return_value = mock_smtp_instance
+        
+        responses = await mail_service.send_emails_batch(
+            [valid_email_request, valid_html_email_request]
+        )
+        
+        assert [r.status for r in responses] == [EmailStatus.SENT, EmailStatus.SENT]
+        assert [r.subject for r in responses] == [
+            valid_email_request.subject,
+            valid_html_email_request.subject,
+        ]
+        assert mock_smtp_instance.sendmail.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_send_emails_batch_sends_every_email_despite_failures(
+    mail_service, valid_email_request
+):
+    """Test that failed sends do not stop the rest of the batch."""
+    with patch("aiosmtplib.SMTP") as mock_smtp:
+        mock_smtp_instance = AsyncMock()
+        mock_smtp_instance.close = MagicMock()
+        mock_smtp_instance.sendmail.side_effect = Exception("SMTP error")
+        mock_smtp.return_value = mock_smtp_instance
+        
+        responses = await mail_service.send_emails_batch(
+            [valid_email_request] * 6, concurrency=1
+        )
+        
+        assert all(r.error_message == "SMTP error" for r in responses)
+        assert mock_smtp_instance.sendmail.call_count == 6
+
+
+@pytest.mark.asyncio
+async def test_email_history_is_bounded(mail_service, valid_email_request):
+    """Test that the oldest history entries are evicted beyond the cap."""
+    mail_service.history_cap = 2
+    with patch("aiosmtplib.SMTP") as mock_smtp:
+        mock_smtp.return_value = AsyncMock()
+        
+        responses = [
+            await mail_service.send_email(valid_email_request) for _ in range(3)
+        ]
+    
+    history = await mail_service.get_email_history()
+    
+    assert [h.message_id for h in history] == [r.message_id for r in responses[1:]]
+    assert await mail_service.get_email_by_id(responses[0].message_id) is None
+
+
+@pytest.mark.asyncio
+async def test_email_history_keeps_body_preview(mail_service):
+    """Test that history stores a body preview and digest, not the full body."""
+    mail_service.history_body_preview_chars = 10
+    body = "x" * 100
+    email_request = EmailRequest(to=["test@example.com"], subject="Test", body=body)
+    with patch("aiosmtplib.SMTP") as mock_smtp:
+        mock_smtp.return_value = AsyncMock()
+        
+        response = await mail_service.send_email(email_request)
+    
+    entry = await mail_service.get_email_by_id(response.message_id)
+    
+    assert entry.body == "x" * 10
+    assert entry.body_length == 100
+    assert entry.body_truncated is True
+    assert entry.body_sha256 == hashlib.sha256(body.encode("utf-8")).hexdigest()
+
+
+@pytest.mark.asyncio
+async def test_create_email_message_skips_missing_attachments(mail_service, tmp_path):
+    """Test that readable attachments are added and missing ones skipped."""
+    test_file = tmp_path / "test.txt"
+    test_file.write_text("Test attachment content")
+    email_request = EmailRequest(
+        to=["test@example.com"],
+        subject="Test Email with Attachments",
+        body="Test Body",
+        attachments=[str(test_file), str(tmp_path / "missing.txt")]
+    )
+    
+    message = await mail_service._create_email_message(email_request, "test-id")
+    
+    attachments = [
+        part for part in message.walk()
+        if part.get("Content-Disposition", "").startswith("attachment")
+    ]
+    assert message.get_content_type() == "multipart/mixed"
+    assert len(attachments) == 1
+    assert attachments[0].get_filename() == "test.txt"
+    assert attachments[0]["Content-Disposition"] == 'attachment; filename="test.txt"'
+    assert attachments[0].get_payload(decode=True) == b"Test attachment content"
+
+
+@pytest.mark.asyncio
+async def test_create_email_message_without_attachments_is_single_part(
+    mail_service, valid_email_request
+):
+    """Test that an email without attachments is not wrapped in a multipart."""
+    message = await mail_service._create_email_message(valid_email_request, "test-id")
+    
+    assert not message.is_multipart()
+    assert message.get_content_type() == "text/plain"
+    assert message.get_payload(decode=True) == valid_email_request.body.encode()
+
+
+def test_new_message_id_is_unique_and_time_ordered():
+    """Test that message IDs are unique 32-character hex strings in creation order."""
+    from app.mail_service import new_message_id
+    
+    first = new_message_id()
+    second = new_message_id()
+    
+    assert len(first) == 32
+    int(first, 16)
+    assert first != second
+    assert first[:12] <= second[:12]
@@ -4,11 +4,11 @@ import os
 import pytest
 from fastapi import HTTPException
 from app.validation import (
+    ErrorKind,
     ValidationResult,
     validate_email_request,
     validate_email_addresses,
     validate_attachments,
-    MAX_ATTACHMENT_SIZE
 )
 
 
@@ -25,41 +25,48 @@ def test_validation_result_init():
     assert result.errors == {"test": "error"}
 
 
-def test_validation_result_raise_if_invalid():
-    """Test ValidationResult error raising."""
-    # Test valid case
+def test_shared_valid_result_is_read_only():
+    """Test that the result shared by successful validations cannot be mutated."""
+    result = validate_email_addresses(["test@example.com"])
+    
+    with pytest.raises(TypeError):
+        result.errors["email"] = "Invalid email format"
+    with pytest.raises(AttributeError):
+        result.is_valid = False
+    assert validate_email_addresses(["test@example.com"]).errors == {}
+
+
+def test_validation_result_raise_if_invalid_when_valid():
+    """Test that a valid result does not raise."""
     result = ValidationResult(is_valid=True)
     result.raise_if_invalid()  # Should not raise
-    
-    # Test email validation error
-    result = ValidationResult(is_valid=False, errors={"email": "invalid"})
+
+
+@pytest.mark.parametrize("errors,expected_status", [
+    ({"email": "invalid"}, 422),
+    ({"error": "not found"}, 404),
+    ({"error": "unauthorized"}, 401),
+    ({"error": "file too large"}, 413),
+    ({"error": "unsupported media type"}, 415),
+])
+def test_validation_result_raise_if_invalid(errors, expected_status):
+    """Test ValidationResult maps errors to HTTP status codes."""
+    result = ValidationResult(is_valid=False, errors=errors)
     with pytest.raises(HTTPException) as exc:
         result.raise_if_invalid()
-    assert exc.value.status_code == 422
-    
-    # Test not found error
-    result = ValidationResult(is_valid=False, errors={"error": "not found"})
+    assert exc.value.status_code == expected_status
+
+
+def test_validation_result_explicit_kind_overrides_keywords():
+    """Test that an explicit error kind decides the status code."""
+    result = ValidationResult(
+        is_valid=False,
+        errors={"attachment_validation": ["Attachment not found: /tmp/email.pdf"]},
+        kind=ErrorKind.NOT_FOUND,
+    )
     with pytest.raises(HTTPException) as exc:
         result.raise_if_invalid()
     assert exc.value.status_code == 404
-    
-    # Test unauthorized error
-    result = ValidationResult(is_valid=False, errors={"error": "unauthorized"})
-    with pytest.raises(HTTPException) as exc:
-        result.raise_if_invalid()
-    assert exc.value.status_code == 401
-    
-    # Test file too large error
-    result = ValidationResult(is_valid=False, errors={"error": "file too large"})
-    with pytest.raises(HTTPException) as exc:
-        result.raise_if_invalid()
-    assert exc.value.status_code == 413
-    
-    # Test unsupported media type error
-    result = ValidationResult(is_valid=False, errors={"error": "unsupported media type"})
-    with pytest.raises(HTTPException) as exc:
-        result.raise_if_invalid()
-    assert exc.value.status_code == 415
 
 
 def test_validate_email_request():
@@ -93,6 +100,21 @@ def test_validate_email_request():
     assert result.is_valid is False
 
 
+def test_validate_email_request_accepts_model():
+    """Test that an EmailRequest model is validated without conversion."""
+    from app.models import EmailRequest
+
+    email_request = EmailRequest(
+        to=["test@example.com"],
+        cc=["cc@example.com"],
+        subject="Test Subject",
+        body="Test Body"
+    )
+    result = validate_email_request(email_request)
+    assert result.is_valid is True
+    assert email_request.to == ["test@example.com"]
+
+
 def test_validate_email_addresses():
     """Test email address validation."""
     # Test valid emails
@@ -107,33 +129,61 @@ def test_validate_email_addresses():
     assert len(result.errors["email_validation"]) == len(invalid_emails)
 
 
-def test_validate_attachments(tmp_path):
-    """Test attachment validation."""
-    # Create test files
-    valid_file = tmp_path / "test.pdf"
-    valid_file.write_bytes(b"Test content")
-    
-    large_file = tmp_path / "large.pdf"
-    large_file.write_bytes(b"0" * (MAX_ATTACHMENT_SIZE + 1))
+@pytest.mark.parametrize("email", [
+    "user@site.test",
+    "a..b@example.com",
+    "ab@cd--ef.com",
+    "a@" + "b" * 64 + ".com",
+    "a" * 65 + "@example.com",
+])
+def test_validate_email_addresses_rejects_edge_cases(email):
+    """Test that addresses email-validator rejects are reported invalid."""
+    result = validate_email_addresses([email])
     
-    invalid_type = tmp_path / "test.invalid"
-    invalid_type.write_bytes(b"Test content")
-    
-    # Test valid attachment
-    result = validate_attachments([str(valid_file)])
+    assert result.is_valid is False
+
+
+@pytest.fixture(scope="module")
+def attachment_dir(tmp_path_factory):
+    """Create the attachment files shared by the attachment validation tests."""
+    directory = tmp_path_factory.mktemp("attachments")
+    (directory / "test.pdf").write_bytes(b"Test content")
+    (directory / "TEST.PDF").write_bytes(b"Test content")
+    (directory / "test.invalid").write_bytes(b"Test content")
+    return directory
+
+
+@pytest.mark.parametrize("filename", ["test.pdf", "TEST.PDF"])
+def test_validate_attachments_accepts_valid_file(attachment_dir, filename):
+    """Test that allowed attachments pass, whatever the extension case."""
+    result = validate_attachments([str(attachment_dir / filename)])
     assert result.is_valid is True
-    
-    # Test file too large
-    result = validate_attachments([str(large_file)])
+
+
+def test_validate_attachments_rejects_large_file(large_attachment):
+    """Test that attachments over the size limit are rejected."""
+    result = validate_attachments([str(large_attachment)])
     assert result.is_valid is False
     assert "too large" in str(result.errors)
-    
-    # Test invalid file type
-    result = validate_attachments([str(invalid_type)])
-    assert result.is_valid is False
-    assert "Unsupported file type" in str(result.errors)
-    
-    # Test non-existent file
-    result = validate_attachments(["/nonexistent/file.pdf"])
+
+
+@pytest.mark.parametrize("filename,expected_error", [
+    ("test.invalid", "Unsupported file type"),
+    ("missing.pdf", "not found"),
+])
+def test_validate_attachments_rejects_invalid_file(
+    attachment_dir, filename, expected_error
+):
+    """Test attachment validation failures."""
+    result = validate_attachments([str(attachment_dir / filename)])
     assert result.is_valid is False
-    assert "not found" in str(result.errors)
+    assert expected_error in str(result.errors)
+
+
+def test_validate_attachments_reports_kind(attachment_dir):
+    """Test that attachment failures carry the highest-precedence kind."""
+    result = validate_attachments([
+        str(attachment_dir / "test.invalid"),
+        str(attachment_dir / "email-missing.pdf"),
+    ])
+    assert result.kind == ErrorKind.NOT_FOUND
@@ -276,6 +276,11 @@ const EmailHistory: React.FC<EmailHistoryProps> = ({ refreshTrigger }) => {
                                         </Typography>
                                     )}
                                 </Box>
+                                {selectedEmail.body_truncated && (
+                                    <Typography variant="caption" color="text.secondary">
+                                        Showing a preview of the {selectedEmail.body_length} character body
+                                    </Typography>
+                                )}
                             </Box>
 
                             <Box sx={{ mb: 2 }}>
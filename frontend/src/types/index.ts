@@ -27,6 +27,9 @@ export interface EmailHistory {
     bcc?: string[];
     subject: string;
     body: string;
+    body_length?: number;
+    body_sha256?: string;
+    body_truncated?: boolean;
     is_html: boolean;
     sent_at?: string;
     error_message?: string;
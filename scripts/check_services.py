@@ -4,8 +4,8 @@
 import asyncio
 import sys
 import os
-import aiosmtplib
 import httpx
+import orjson
 from typing import Dict, Any
 
 # Add the backend directory to the Python path
@@ -15,38 +15,44 @@ from app.config import settings
 
 
 async def check_kube_mail_connection() -> Dict[str, Any]:
-    """Check if kube-mail service is accessible."""
+    """Check if kube-mail service is accessible.
+
+    Only a TCP connection is opened; reachability does not need an SMTP session.
+    """
+    address = f"{settings.smtp_host}:{settings.smtp_port}"
     try:
-        smtp = aiosmtplib.SMTP(hostname=settings.kube_mail_host, port=settings.kube_mail_port)
-        await smtp.connect()
-        await smtp.quit()
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(settings.smtp_host, settings.smtp_port),
+            timeout=5.0,
+        )
+        writer.close()
+        await writer.wait_closed()
         return {
             "status": "healthy",
-            "message": f"Successfully connected to {settings.kube_mail_host}:{settings.kube_mail_port}"
+            "message": f"Successfully connected to {address}"
         }
     except Exception as e:
         return {
             "status": "unhealthy",
-            "message": f"Failed to connect to {settings.kube_mail_host}:{settings.kube_mail_port}: {str(e)}"
+            "message": f"Failed to connect to {address}: {str(e)}"
         }
 
 
-async def check_backend_service() -> Dict[str, Any]:
+async def check_backend_service(client: httpx.AsyncClient) -> Dict[str, Any]:
     """Check if the backend service is running."""
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get("http://localhost:8000/api/v1/health", timeout=5.0)
-            if response.status_code == 200:
-                data = response.json()
-                return {
-                    "status": "healthy",
-                    "message": f"Backend service is running. Status: {data.get('status', 'unknown')}"
-                }
-            else:
-                return {
-                    "status": "unhealthy",
-                    "message": f"Backend service returned status code: {response.status_code}"
-                }
+        response = await client.get("http://localhost:8000/api/v1/health")
+        if response.status_code == 200:
+            data = orjson.loads(response.content)
+            return {
+                "status": "healthy",
+                "message": f"Backend service is running. Status: {data.get('status', 'unknown')}"
+            }
+        else:
+            return {
+                "status": "unhealthy",
+                "message": f"Backend service returned status code: {response.status_code}"
+            }
     except Exception as e:
         return {
             "status": "unhealthy",
@@ -54,21 +60,20 @@ async def check_backend_service() -> Dict[str, Any]:
         }
 
 
-async def check_frontend_service() -> Dict[str, Any]:
+async def check_frontend_service(client: httpx.AsyncClient) -> Dict[str, Any]:
     """Check if the frontend service is running."""
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get("http://localhost:3000/health", timeout=5.0)
-            if response.status_code == 200:
-                return {
-                    "status": "healthy",
-                    "message": "Frontend service is running"
-                }
-            else:
-                return {
-                    "status": "unhealthy",
-                    "message": f"Frontend service returned status code: {response.status_code}"
-                }
+        response = await client.get("http://localhost:3000/health")
+        if response.status_code == 200:
+            return {
+                "status": "healthy",
+                "message": "Frontend service is running"
+            }
+        else:
+            return {
+                "status": "unhealthy",
+                "message": f"Frontend service returned status code: {response.status_code}"
+            }
     except Exception as e:
         return {
             "status": "unhealthy",
@@ -81,26 +86,24 @@ async def main():
     print("🔍 Checking Mail Service Dependencies...")
     print("=" * 50)
     
-    # Check kube-mail connection
-    print("📧 Checking kube-mail connection...")
-    kube_mail_result = await check_kube_mail_connection()
-    print(f"   Status: {kube_mail_result['status'].upper()}")
-    print(f"   Message: {kube_mail_result['message']}")
-    print()
-    
-    # Check backend service
-    print("🔧 Checking backend service...")
-    backend_result = await check_backend_service()
-    print(f"   Status: {backend_result['status'].upper()}")
-    print(f"   Message: {backend_result['message']}")
-    print()
+    # Run all checks concurrently over one HTTP client, then report them in a
+    # fixed order
+    async with httpx.AsyncClient(timeout=5.0) as client:
+        kube_mail_result, backend_result, frontend_result = await asyncio.gather(
+            check_kube_mail_connection(),
+            check_backend_service(client),
+            check_frontend_service(client),
+        )
     
-    # Check frontend service
-    print("🎨 Checking frontend service...")
-    frontend_result = await check_frontend_service()
-    print(f"   Status: {frontend_result['status'].upper()}")
-    print(f"   Message: {frontend_result['message']}")
-    print()
+    for label, result in (
+        ("📧 Checking kube-mail connection...", kube_mail_result),
+        ("🔧 Checking backend service...", backend_result),
+        ("🎨 Checking frontend service...", frontend_result),
+    ):
+        print(label)
+        print(f"   Status: {result['status'].upper()}")
+        print(f"   Message: {result['message']}")
+        print()
     
     # Summary
     print("📊 Summary:")
@@ -4,15 +4,18 @@
 import asyncio
 import sys
 import os
-import json
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, List
+
+from pydantic import BaseModel, TypeAdapter
 
 # Add the backend directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
 
 from app.models import EmailRequest, EmailHistory, EmailStatus
-from app.mail_service import mail_service
+
+# Validates sample history in bulk in pydantic-core
+_email_history_list_adapter = TypeAdapter(List[EmailHistory])
 
 
 def generate_sample_email_requests(count: int = 5) -> List[EmailRequest]:
@@ -58,13 +61,16 @@ def generate_sample_email_requests(count: int = 5) -> List[EmailRequest]:
 
 def generate_sample_email_history(count: int = 10) -> List[EmailHistory]:
     """Generate sample email history for testing."""
-    base_time = datetime.utcnow()
-    history = []
+    # Emails are spaced two hours apart, newest first
+    interval = timedelta(hours=2)
+    send_delay = timedelta(minutes=5)
+    created_at = datetime.now(timezone.utc) + interval
+    records = []
     
     for i in range(count):
         # Create varied timestamps
-        created_at = base_time - timedelta(hours=i*2)
-        sent_at = created_at + timedelta(minutes=5) if i % 3 != 0 else None
+        created_at -= interval
+        sent_at = created_at + send_delay if i % 3 != 0 else None
         
         # Vary the status
         if i % 4 == 0:
@@ -77,30 +83,32 @@ def generate_sample_email_history(count: int = 10) -> List[EmailHistory]:
             status = EmailStatus.SENT
             error_message = None
         
-        email_history = EmailHistory(
-            message_id=f"msg-{i:03d}-{int(created_at.timestamp())}",
-            status=status,
-            to=[f"recipient{i}@example.com"],
-            cc=[f"cc{i}@example.com"] if i % 2 == 0 else None,
-            subject=f"Sample Email {i+1}",
-            body=f"This is sample email content {i+1}.\n\nGenerated for testing purposes.",
-            is_html=i % 2 == 0,
-            sent_at=sent_at,
-            error_message=error_message,
-            created_at=created_at
-        )
-        
-        history.append(email_history)
-    
-    return history
+        records.append({
+            "message_id": f"msg-{i:03d}-{int(created_at.timestamp())}",
+            "status": status,
+            "to": [f"recipient{i}@example.com"],
+            "cc": [f"cc{i}@example.com"] if i % 2 == 0 else None,
+            "subject": f"Sample Email {i+1}",
+            "body": f"This is sample email content {i+1}.\n\nGenerated for testing purposes.",
+            "is_html": i % 2 == 0,
+            "sent_at": sent_at,
+            "error_message": error_message,
+            "created_at": created_at,
+        })
+    
+    # Validate every entry in a single pydantic-core call
+    return _email_history_list_adapter.validate_python(records)
 
 
 async def populate_mail_service_history(history: List[EmailHistory]):
     """Populate the mail service with sample history."""
+    # Imported lazily: loading the mail service pulls in SMTP and FastAPI
+    from app.mail_service import mail_service
+    
     print("📧 Populating mail service with sample history...")
     
     for email_history in history:
-        mail_service.email_history.append(email_history)
+        mail_service.add_to_history(email_history)
     
     print(f"✅ Added {len(history)} sample emails to history")
 
@@ -109,30 +117,49 @@ async def send_sample_emails(requests: List[EmailRequest], dry_run: bool = True)
     """Send sample emails (or simulate sending in dry run mode)."""
     print(f"📤 {'Simulating' if dry_run else 'Sending'} {len(requests)} sample emails...")
     
-    for i, request in enumerate(requests, 1):
-        print(f"   Processing email {i}/{len(requests)}: {request.subject}")
-        
-        if dry_run:
+    if dry_run:
+        for i, request in enumerate(requests, 1):
+            print(f"   Processing email {i}/{len(requests)}: {request.subject}")
             # Simulate sending
             print(f"   [DRY RUN] Would send to: {', '.join(request.to)}")
+        return
+    
+    from app.mail_service import mail_service
+    
+    # Actually send the emails, concurrently over the SMTP connection pool
+    try:
+        responses = await mail_service.send_emails_batch(requests)
+    finally:
+        # QUIT the pooled connections before asyncio.run closes the loop
+        await mail_service.close()
+    
+    for i, (request, response) in enumerate(zip(requests, responses), 1):
+        print(f"   Processing email {i}/{len(requests)}: {request.subject}")
+        if response.status == EmailStatus.FAILED:
+            print(f"   ❌ Failed to send: {response.error_message}")
         else:
-            # Actually send the email
-            try:
-                response = await mail_service.send_email(request)
-                print(f"   ✅ Sent successfully. Status: {response.status}")
-            except Exception as e:
-                print(f"   ❌ Failed to send: {str(e)}")
+            print(f"   ✅ Sent successfully. Status: {response.status}")
+
 
+def save_sample_data_to_file(data: Iterable[BaseModel], filename: str):
+    """Save sample models to a JSON file as an array, one record per line.
 
-def save_sample_data_to_file(data: List[Dict[str, Any]], filename: str):
-    """Save sample data to a JSON file."""
+    Records are serialized and written one at a time, so the whole document
+    is never held in memory.
+    """
     filepath = os.path.join(os.path.dirname(__file__), '..', 'data', filename)
     
     # Create data directory if it doesn't exist
     os.makedirs(os.path.dirname(filepath), exist_ok=True)
     
-    with open(filepath, 'w') as f:
-        json.dump(data, f, indent=2, default=str)
+    with open(filepath, 'w', encoding='utf-8') as f:
+        f.write("[")
+        separator = "\n  "
+        for model in data:
+            f.write(separator)
+            f.write(model.model_dump_json())
+            separator = ",\n  "
+        f.write("\n]\n")
     
     print(f"💾 Saved sample data to {filepath}")
 
@@ -169,14 +196,15 @@ async def main():
     sample_history = generate_sample_email_history(count)
     
     # Save to files
-    requests_data = [req.dict() for req in sample_requests]
-    history_data = [hist.dict() for hist in sample_history]
+    save_sample_data_to_file(sample_requests, 'sample_email_requests.json')
+    save_sample_data_to_file(sample_history, 'sample_email_history.json')
     
-    save_sample_data_to_file(requests_data, 'sample_email_requests.json')
-    save_sample_data_to_file(history_data, 'sample_email_history.json')
-    
-    # Populate mail service history
-    await populate_mail_service_history(sample_history)
+    # Populate mail service history; in a dry run there is no mail service
+    # to populate, so it is not loaded at all
+    if dry_run:
+        print(f"📧 [DRY RUN] Would add {len(sample_history)} sample emails to history")
+    else:
+        await populate_mail_service_history(sample_history)
     
     # Send or simulate sending emails
     await send_sample_emails(sample_requests, dry_run)
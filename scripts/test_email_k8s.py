@@ -69,13 +69,17 @@ async def main():
     print("Mail Service Test - Kubernetes Pod")
     print("=" * 50)
     
-    # Test SMTP connection first
-    await test_smtp_connection()
-    print()
-    
-    # Test email sending
-    await test_email_sending()
-    print()
+    try:
+        # Test SMTP connection first
+        await test_smtp_connection()
+        print()
+        
+        # Test email sending
+        await test_email_sending()
+        print()
+    finally:
+        # QUIT the pooled connections before asyncio.run closes the loop
+        await mail_service.close()
     
     print("Test completed!")
 
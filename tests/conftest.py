@@ -0,0 +1,19 @@
+"""Shared fixtures for the top-level test suite."""
+
+import asyncio
+
+import pytest
+
+try:
+    import uvloop
+except ImportError:  # uvloop ships with uvicorn[standard]
+    uvloop = None
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """Run every asyncio test on one event loop, using uvloop when available."""
+    loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
@@ -3,60 +3,100 @@
 import pytest
 import asyncio
 from unittest.mock import Mock, patch, AsyncMock
-from datetime import datetime
+from datetime import datetime, timezone
 
-from backend.app.models import EmailRequest, EmailStatus
+from backend.app.models import EmailHistory, EmailRequest, EmailStatus
 from backend.app.mail_service import MailService
 from backend.app.validation import ValidationResult, validate_email_request, validate_email_addresses
 
 
+class RecordingSender:
+    """Stand-in for MailService._send_via_smtp that records its calls."""
+
+    def __init__(self):
+        self.calls = []
+        self.error = None
+
+    async def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        if self.error is not None:
+            raise self.error
+
+
 class TestMailService:
     """Test cases for MailService class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mail_service(self):
-        """Create a MailService instance for testing."""
+        """Create a MailService instance shared by the tests in this module."""
         return MailService()
 
+    @pytest.fixture(autouse=True)
+    def reset_state(self, mail_service):
+        """Start every test with an empty email history and SMTP pool."""
+        mail_service._history.clear()
+        mail_service._idle_connections.clear()
+
+    @pytest.fixture
+    def fake_sender(self, mail_service, monkeypatch):
+        """Replace the SMTP send on the mail service with a RecordingSender."""
+        sender = RecordingSender()
+        monkeypatch.setattr(mail_service, "_send_via_smtp", sender)
+        return sender
+
     @pytest.fixture
     def sample_email_request(self):
-        """Create a sample email request for testing."""
-        return EmailRequest(
+        """Create a sample email request for testing (inputs are known valid)."""
+        return EmailRequest.model_construct(
             to=["test@example.com"],
             subject="Test Subject",
             body="Test body content",
-            is_html=False
+            is_html=False,
+            cc=None,
+            bcc=None,
+            attachments=None
+        )
+
+    @pytest.fixture
+    def seeded(self, mail_service, sample_email_request):
+        """Record a sent email directly in the history, without sending it."""
+        entry = EmailHistory(
+            message_id="seed-1",
+            status=EmailStatus.SENT,
+            to=sample_email_request.to,
+            subject=sample_email_request.subject,
+            body=sample_email_request.body,
+            is_html=sample_email_request.is_html,
+            sent_at=datetime.now(timezone.utc)
         )
+        mail_service.add_to_history(entry)
+        return entry
 
     @pytest.mark.asyncio
-    async def test_send_email_success(self, mail_service, sample_email_request):
+    async def test_send_email_success(self, mail_service, sample_email_request, fake_sender):
         """Test successful email sending."""
-        with patch.object(mail_service, '_send_via_kube_mail', new_callable=AsyncMock) as mock_send:
-            mock_send.return_value = None
-            
-            response = await mail_service.send_email(sample_email_request)
-            
-            assert response.status == EmailStatus.SENT
-            assert response.message_id is not None
-            assert response.to == sample_email_request.to
-            assert response.subject == sample_email_request.subject
-            assert response.sent_at is not None
-            assert response.error_message is None
-            
-            mock_send.assert_called_once()
+        response = await mail_service.send_email(sample_email_request)
+        
+        assert response.status == EmailStatus.SENT
+        assert response.message_id is not None
+        assert response.to == sample_email_request.to
+        assert response.subject == sample_email_request.subject
+        assert response.sent_at is not None
+        assert response.error_message is None
+        
+        assert len(fake_sender.calls) == 1
 
     @pytest.mark.asyncio
-    async def test_send_email_failure(self, mail_service, sample_email_request):
+    async def test_send_email_failure(self, mail_service, sample_email_request, fake_sender):
         """Test email sending failure."""
-        with patch.object(mail_service, '_send_via_kube_mail', new_callable=AsyncMock) as mock_send:
-            mock_send.side_effect = Exception("SMTP connection failed")
-            
-            response = await mail_service.send_email(sample_email_request)
-            
-            assert response.status == EmailStatus.FAILED
-            assert response.message_id is not None
-            assert response.error_message == "SMTP connection failed"
-            assert response.sent_at is None
+        fake_sender.error = Exception("SMTP connection failed")
+        
+        response = await mail_service.send_email(sample_email_request)
+        
+        assert response.status == EmailStatus.FAILED
+        assert response.message_id is not None
+        assert response.error_message == "SMTP connection failed"
+        assert response.sent_at is None
 
     @pytest.mark.asyncio
     async def test_create_email_message(self, mail_service, sample_email_request):
@@ -64,36 +104,30 @@ class TestMailService:
         message_id = "test-message-id"
         
         message = await mail_service._create_email_message(sample_email_request, message_id)
+        headers = dict(message.items())
         
-        assert message['From'] == f"{mail_service.from_name} <{mail_service.from_email}>"
-        assert message['To'] == ', '.join(sample_email_request.to)
-        assert message['Subject'] == sample_email_request.subject
-        assert message['Message-ID'] == f"<{message_id}@{mail_service.from_email.split('@')[1]}>"
+        assert headers['From'] == f"{mail_service.from_name} <{mail_service.from_email}>"
+        assert headers['To'] == ', '.join(sample_email_request.to)
+        assert headers['Subject'] == sample_email_request.subject
+        assert headers['Message-ID'] == f"<{message_id}@{mail_service.from_email.split('@')[1]}>"
 
     @pytest.mark.asyncio
-    async def test_get_email_history(self, mail_service, sample_email_request):
+    async def test_get_email_history(self, mail_service, seeded):
         """Test getting email history."""
-        # Send an email first
-        with patch.object(mail_service, '_send_via_kube_mail', new_callable=AsyncMock):
-            await mail_service.send_email(sample_email_request)
-        
         history = await mail_service.get_email_history()
         
         assert len(history) == 1
-        assert history[0].to == sample_email_request.to
-        assert history[0].subject == sample_email_request.subject
+        assert history[0].to == seeded.to
+        assert history[0].subject == seeded.subject
 
     @pytest.mark.asyncio
-    async def test_get_email_by_id(self, mail_service, sample_email_request):
+    async def test_get_email_by_id(self, mail_service, seeded):
         """Test getting email by message ID."""
-        with patch.object(mail_service, '_send_via_kube_mail', new_callable=AsyncMock):
-            response = await mail_service.send_email(sample_email_request)
-        
-        email = await mail_service.get_email_by_id(response.message_id)
+        email = await mail_service.get_email_by_id(seeded.message_id)
         
         assert email is not None
-        assert email.message_id == response.message_id
-        assert email.to == sample_email_request.to
+        assert email.message_id == seeded.message_id
+        assert email.to == seeded.to
 
     @pytest.mark.asyncio
     async def test_get_email_by_id_not_found(self, mail_service):
@@ -103,23 +137,35 @@ class TestMailService:
         assert email is None
 
     @pytest.mark.asyncio
-    async def test_check_kube_mail_connection_success(self, mail_service):
-        """Test successful kube-mail connection check."""
+    async def test_smtp_pool_reused(self, mail_service, sample_email_request):
+        """Test that consecutive sends reuse one pooled SMTP connection."""
         with patch('aiosmtplib.SMTP') as mock_smtp:
-            mock_smtp.return_value.__aenter__ = AsyncMock()
-            mock_smtp.return_value.__aexit__ = AsyncMock()
+            mock_smtp.return_value = AsyncMock()
             
-            result = await mail_service.check_kube_mail_connection()
+            await mail_service.send_email(sample_email_request)
+            await mail_service.send_email(sample_email_request)
+            
+            mock_smtp.assert_called_once()
+            assert mock_smtp.return_value.sendmail.call_count == 2
+            assert mail_service._idle_connections == [mock_smtp.return_value]
+
+    @pytest.mark.asyncio
+    async def test_check_smtp_connection_success(self, mail_service):
+        """Test successful SMTP connection check."""
+        with patch('aiosmtplib.SMTP') as mock_smtp:
+            mock_smtp.return_value = AsyncMock()
+            
+            result = await mail_service.check_smtp_connection()
             
             assert result is True
 
     @pytest.mark.asyncio
-    async def test_check_kube_mail_connection_failure(self, mail_service):
-        """Test failed kube-mail connection check."""
+    async def test_check_smtp_connection_failure(self, mail_service):
+        """Test failed SMTP connection check."""
         with patch('aiosmtplib.SMTP') as mock_smtp:
             mock_smtp.side_effect = Exception("Connection failed")
             
-            result = await mail_service.check_kube_mail_connection()
+            result = await mail_service.check_smtp_connection()
             
             assert result is False
 
@@ -230,29 +276,19 @@ class TestEmailRequestModel:
         
         assert email_request.is_html is True
 
-    def test_email_request_validation_empty_recipients(self):
-        """Test email request validation with empty recipients."""
-        with pytest.raises(ValueError, match="At least one recipient must be provided"):
-            EmailRequest(
-                to=[],
-                subject="Test Subject",
-                body="Test body content"
-            )
-
-    def test_email_request_validation_empty_subject(self):
-        """Test email request validation with empty subject."""
-        with pytest.raises(ValueError, match="Subject cannot be empty"):
-            EmailRequest(
-                to=["test@example.com"],
-                subject="   ",
-                body="Test body content"
-            )
-
-    def test_email_request_validation_empty_body(self):
-        """Test email request validation with empty body."""
-        with pytest.raises(ValueError, match="Body cannot be empty"):
-            EmailRequest(
-                to=["test@example.com"],
-                subject="Test Subject",
-                body="   "
-            )
+    @pytest.mark.parametrize("field,value,message", [
+        ("to", [], "At least one recipient must be provided"),
+        ("subject", "   ", "Subject cannot be empty"),
+        ("body", "   ", "Body cannot be empty"),
+    ])
+    def test_email_request_validation_required_fields(self, field, value, message):
+        """Test email request validation of empty required fields."""
+        data = {
+            "to": ["test@example.com"],
+            "subject": "Test Subject",
+            "body": "Test body content",
+            field: value
+        }
+        
+        with pytest.raises(ValueError, match=message):
+            EmailRequest(**data)